@@ -7,68 +7,282 @@ This tool provides an easy-to-use interface for managing SQLite databases with b
 
 import sqlite3
 import os
+import csv
 import sys
 import json
+import re
+import itertools
+import threading
+import traceback
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
 
+# Set SQL_PANCAKE_DEBUG=1 to print full tracebacks for errors in the CLI
+DEBUG = os.environ.get('SQL_PANCAKE_DEBUG') == '1'
+
+# SQL issued by DatabaseManager itself. Keeping each statement as one shared
+# string means sqlite3's statement cache finds it without re-preparing.
+_SQL_LIST_TABLES = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+# pragma_table_info() accepts a bound table name, unlike PRAGMA table_info
+_SQL_TABLE_INFO = 'SELECT cid, name, type, "notnull", dflt_value, pk FROM pragma_table_info(?)'
+_SQL_ALL_COLUMNS = """
+    SELECT m.name AS tbl, p.name, p.type, p."notnull", p.dflt_value, p.pk
+    FROM sqlite_master m JOIN pragma_table_info(m.name) p
+    WHERE m.type = 'table'
+    ORDER BY m.name, p.cid
+"""
+
+# Open connections kept for reuse between DatabaseManager instances, keyed by
+# absolute database path: {path: [connection, refcount]}. A pooled connection
+# is only handed out while nobody holds it (refcount 0), so live managers never
+# share a connection or each other's transactions. Reusing a connection keeps
+# SQLite's page cache warm and avoids re-opening the -wal/-shm files, which
+# only pays off when a process connects to the same database repeatedly.
+_connection_pool = {}
+_pool_lock = threading.Lock()
+
+
+def _pool_key(db_path):
+    """Return the pool key for a database path, or None if it can't be shared"""
+    if not db_path or db_path == ':memory:':
+        return None
+    return os.path.abspath(db_path)
+
+
+def _discard_pooled_connection(db_path):
+    """
+    Close and forget the pooled connection for db_path, if any
+    
+    Raises:
+        RuntimeError: If a DatabaseManager is still holding the connection
+    """
+    key = _pool_key(db_path)
+    with _pool_lock:
+        entry = _connection_pool.get(key) if key else None
+        if entry and entry[1]:
+            raise RuntimeError(f"Database {db_path} is in use by another DatabaseManager")
+        if entry:
+            del _connection_pool[key]
+    if entry:
+        entry[0].close()
+
+
+# Statements that can't run inside a transaction, or that mean something
+# different there (PRAGMA foreign_keys is a no-op inside one)
+_NO_WRAP_KEYWORDS = frozenset(['BEGIN', 'COMMIT', 'END', 'ROLLBACK', 'SAVEPOINT', 'RELEASE',
+                               'PRAGMA', 'VACUUM'])
+
+
+def _skip_leading_comments(sql):
+    """Return sql without leading whitespace, -- comments and /* */ comments"""
+    while True:
+        sql = sql.lstrip()
+        if sql.startswith('--'):
+            end = sql.find('\n')
+            sql = '' if end == -1 else sql[end + 1:]
+        elif sql.startswith('/*'):
+            end = sql.find('*/')
+            sql = '' if end == -1 else sql[end + 2:]
+        else:
+            return sql
+
+
+def _split_statements(sql_script):
+    """
+    Yield the statements of a SQL script one at a time
+    
+    SQLite's own tokenizer decides where each statement ends, so semicolons in
+    string literals and CREATE TRIGGER ... BEGIN ... END bodies don't split a
+    statement in two. A last statement without its semicolon is still yielded.
+    """
+    buf = ''
+    for line in sql_script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            yield buf.strip()
+            buf = ''
+    if _skip_leading_comments(buf):
+        yield buf.strip()
+
+
+def _can_wrap_in_transaction(sql_script):
+    """Return True if no statement in the script is transaction control, PRAGMA or VACUUM"""
+    for statement in _split_statements(sql_script):
+        keyword = re.match(r'[A-Za-z]*', _skip_leading_comments(statement)).group().upper()
+        if keyword in _NO_WRAP_KEYWORDS:
+            return False
+    return True
+
+
 class DatabaseManager:
     """Manages SQL database operations with best practices built-in"""
     
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, journal_mode='WAL', synchronous=None,
+                 mmap_size=256 * 1024 * 1024, cache_size=-64000, page_size=8192):
         """
         Initialize the database manager
         
         Args:
             db_path (str): Path to the database file. If None, creates in-memory database.
+            journal_mode (str): SQLite journal mode to use on connect (WAL by default).
+                Pass 'DELETE' to keep SQLite's classic rollback journal.
+            synchronous (str): SQLite synchronous level. By default NORMAL in WAL mode and
+                FULL otherwise, since NORMAL is only corruption-safe with WAL.
+            mmap_size (int): Bytes of the database file to memory-map for reads (0 disables).
+            cache_size (int): SQLite page cache size; negative values are in KiB (-64000 = 64 MiB).
+            page_size (int): Page size for newly created databases (existing files keep theirs).
         """
         self.db_path = db_path
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size
+        self.page_size = page_size
         self.conn = None
         self.cursor = None
         
+    @classmethod
+    def from_pool(cls, db_path, **kwargs):
+        """
+        Return a manager connected to db_path, reusing an idle pooled connection if there is one
+        
+        Args:
+            db_path (str): Path to the database file
+            **kwargs: Connection options passed to DatabaseManager()
+        """
+        return cls(db_path, **kwargs).connect()
+        
     def connect(self, db_path=None):
         """
         Connect to a database
         
+        A file database's pooled connection is reused if no other manager is
+        holding it; otherwise this manager gets a private connection.
+        
         Args:
             db_path (str): Path to the database file
         """
+        if not (db_path or self.db_path):
+            raise ValueError("No database path specified")
+            
+        # Give back whatever connection this manager held before switching
+        self.release()
+        
         if db_path:
             self.db_path = db_path
             
-        if not self.db_path:
-            raise ValueError("No database path specified")
-            
+        key = _pool_key(self.db_path)
+        with _pool_lock:
+            entry = _connection_pool.get(key) if key else None
+            if entry and entry[1] == 0:
+                entry[1] = 1
+                self.conn = entry[0]
+                self.cursor = self.conn.cursor()
+                # The previous holder may have asked for different settings
+                self._configure_connection()
+            else:
+                self._open_connection()
+                # A connection already in use stays with its holder; this one
+                # is private and gets closed on release()
+                if key and not entry:
+                    _connection_pool[key] = [self.conn, 1]
+                    
+        print(f"✓ Connected to database: {self.db_path}")
+        return self
+        
+    def _open_connection(self):
+        """Open a new SQLite connection for self.db_path and apply connection pragmas"""
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.db_path) if os.path.dirname(self.db_path) else '.', exist_ok=True)
+        parent = os.path.dirname(self.db_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
         
-        self.conn = sqlite3.connect(self.db_path)
+        # isolation_level=None turns off sqlite3's implicit BEGIN heuristics:
+        # statements autocommit unless wrapped in begin()/transaction().
+        # sqlite3 keeps compiled statements keyed by SQL text; a bigger cache
+        # keeps repeated INSERT/SELECT strings from being re-prepared.
+        # detect_types=0 leaves DATETIME/TIMESTAMP columns as plain text rather
+        # than running a converter on every value fetched.
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False,
+                                    cached_statements=256, detect_types=0)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        self.conn.text_factory = str  # Decode TEXT straight to str (set a custom factory to override)
         self.cursor = self.conn.cursor()
+        self._configure_connection()
         
+    def _configure_connection(self):
+        """Apply this manager's pragmas to self.conn"""
         # Enable foreign key constraints (best practice)
         self.cursor.execute("PRAGMA foreign_keys = ON")
         
-        print(f"✓ Connected to database: {self.db_path}")
-        return self
+        # Larger pages mean shallower B-trees and fewer I/Os per lookup. This
+        # only takes effect on a new, empty database, and has to come before
+        # switching to WAL, after which the page size is fixed.
+        if self.page_size:
+            self.cursor.execute(f"PRAGMA page_size = {int(self.page_size)}")
         
-    def create_database(self, db_path, schema_file=None):
+        # WAL lets readers and writers run concurrently and halves write I/O.
+        # SQLite reports the mode actually in effect, which stays on the old
+        # journal when the VFS lacks shared-memory support (e.g. NFS).
+        if self.journal_mode:
+            self.cursor.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+            mode = self.cursor.fetchone()[0]
+            if mode.upper() not in (self.journal_mode.upper(), 'MEMORY'):
+                self.cursor.execute("PRAGMA journal_mode = DELETE")
+                mode = self.cursor.fetchone()[0]
+        else:
+            self.cursor.execute("PRAGMA journal_mode")
+            mode = self.cursor.fetchone()[0]
+        # synchronous=NORMAL can corrupt a rollback-journal database on power
+        # loss, so only default to it when WAL is actually in effect
+        synchronous = self.synchronous or ('NORMAL' if mode.upper() == 'WAL' else 'FULL')
+        self.cursor.execute(f"PRAGMA synchronous = {synchronous}")
+        # Checkpoint less often so checkpoint I/O rarely stalls a transaction
+        self.cursor.execute("PRAGMA wal_autocheckpoint = 10000")
+        
+        # Keep temporary B-trees for ORDER BY/GROUP BY in RAM instead of /tmp,
+        # and don't spill dirty pages to disk in the middle of a transaction
+        self.cursor.execute("PRAGMA temp_store = MEMORY")
+        self.cursor.execute("PRAGMA cache_spill = 0")
+        
+        # Serve reads straight from a memory-mapped view of the file instead
+        # of copying every page through read(). SQLite answers with the size
+        # it actually applied, which is 0 when the VFS cannot mmap.
+        if self.mmap_size is not None:
+            self.cursor.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+            row = self.cursor.fetchone()
+            if self.mmap_size and self.db_path != ':memory:' and not (row and row[0]):
+                print("Note: memory-mapped I/O is not available for this database")
+        if self.cache_size is not None:
+            self.cursor.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        
+    def create_database(self, db_path, schema_file=None, *, overwrite=False):
         """
         Create a new database with optional schema
         
         Args:
             db_path (str): Path where database will be created
             schema_file (str): Optional path to SQL schema file
+            overwrite (bool): Replace an existing database at db_path. Without it,
+                an existing database is left untouched and None is returned.
+                
+        Raises:
+            RuntimeError: If overwrite is set and another manager has db_path open
         """
+        if not overwrite and os.path.exists(db_path):
+            print(f"Database {db_path} already exists. Use overwrite=True to replace it.")
+            return None
+            
+        self.release()
         self.db_path = db_path
         
-        if os.path.exists(db_path):
-            response = input(f"Database {db_path} already exists. Overwrite? (yes/no): ")
-            if response.lower() != 'yes':
-                print("Operation cancelled.")
-                return None
-            os.remove(db_path)
+        if overwrite:
+            _discard_pooled_connection(db_path)
+            # Drop the WAL files too, or SQLite could replay them into the new database
+            for suffix in ('', '-wal', '-shm'):
+                Path(db_path + suffix).unlink(missing_ok=True)
         
         self.connect(db_path)
         
@@ -85,27 +299,44 @@ class DatabaseManager:
         Args:
             schema_file (str): Path to SQL schema file
         """
-        with open(schema_file, 'r') as f:
+        with open(schema_file, 'r', encoding='utf-8') as f:
             schema_sql = f.read()
             
         # Use executescript which handles multi-statement SQL better
         try:
-            self.conn.executescript(schema_sql)
-            self.conn.commit()
+            self._execute_script(schema_sql)
             print(f"✓ Schema loaded from: {schema_file}")
         except sqlite3.Error as e:
             print(f"Error loading schema: {e}")
             # Fall back to statement-by-statement execution
-            statements = [stmt.strip() for stmt in schema_sql.split(';') if stmt.strip()]
-            for statement in statements:
+            wrap = _can_wrap_in_transaction(schema_sql)
+            if wrap:
+                self.begin()
+            for statement in _split_statements(schema_sql):
                 try:
                     self.cursor.execute(statement)
                 except sqlite3.Error as stmt_error:
-                    # Only print error for non-comment statements
-                    if not statement.startswith('--'):
-                        print(f"Warning: {stmt_error}")
-            self.conn.commit()
+                    print(f"Warning: {stmt_error}")
+            if wrap:
+                self.commit()
             print(f"✓ Schema loaded from: {schema_file}")
+            
+    def _execute_script(self, sql_script, wrap=True):
+        """
+        Run a multi-statement SQL script
+        
+        With wrap, the script runs in a single transaction unless one of its
+        statements is transaction control, PRAGMA or VACUUM; such scripts run
+        unchanged. An open transaction is rolled back if any statement fails.
+        """
+        if wrap and _can_wrap_in_transaction(sql_script):
+            sql_script = f"BEGIN;\n{sql_script}\n;COMMIT;"
+        try:
+            self.conn.executescript(sql_script)
+        except sqlite3.Error:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            raise
         
     def execute_query(self, query, params=None):
         """
@@ -116,39 +347,121 @@ class DatabaseManager:
             params (tuple): Parameters to substitute in query
             
         Returns:
-            List of results for SELECT queries, None for others
+            List of results for statements that return rows, None for others.
+            Outside a transaction, SQL errors are printed and None is returned.
+            
+        Raises:
+            sqlite3.Error: If the statement fails inside an open transaction
+                (begin() or transaction()), so the caller can roll it back
         """
         if not self.conn:
             raise RuntimeError("Not connected to a database")
             
+        # The connection runs in autocommit mode, so a statement is committed
+        # on its own unless the caller opened a transaction with begin() or
+        # transaction(); committing that is the caller's job.
+        in_transaction = self.conn.in_transaction
         try:
             if params:
                 self.cursor.execute(query, params)
             else:
                 self.cursor.execute(query)
                 
-            # If it's a SELECT or PRAGMA query, fetch results
-            query_upper = query.strip().upper()
-            if query_upper.startswith('SELECT') or query_upper.startswith('PRAGMA'):
-                results = self.cursor.fetchall()
-                return results
-            else:
-                self.conn.commit()
-                return None
+            # Any statement that produces rows (SELECT, PRAGMA, WITH, EXPLAIN,
+            # ... RETURNING) sets cursor.description; fetch those results
+            if self.cursor.description is not None:
+                return self.cursor.fetchall()
+            return None
         except sqlite3.Error as e:
+            # Inside a caller's transaction the error has to reach it so the
+            # whole transaction rolls back instead of committing partial work
+            if in_transaction:
+                raise
             print(f"SQL Error: {e}")
             return None
             
+    def executemany(self, query, seq_of_params):
+        """
+        Execute a SQL statement once per parameter set in a single transaction
+        
+        One COMMIT (and one fsync) covers the whole batch, and parameters are
+        bound in sqlite3's C loop rather than one execute_query call per row.
+        A failing batch is rolled back; inside an outer transaction() the error
+        is raised so that transaction rolls back too.
+        
+        Args:
+            query (str): SQL statement with ? placeholders
+            seq_of_params (iterable): Sequence of parameter tuples
+        """
+        if not self.conn:
+            raise RuntimeError("Not connected to a database")
+            
+        in_transaction = self.conn.in_transaction
+        try:
+            with self.transaction():
+                self.cursor.executemany(query, seq_of_params)
+        except sqlite3.Error as e:
+            if in_transaction:
+                raise
+            print(f"SQL Error: {e}")
+        return None
+            
+    def begin(self):
+        """Start an explicit transaction; statements run until commit() or rollback()"""
+        if not self.conn:
+            raise RuntimeError("Not connected to a database")
+        self.conn.execute("BEGIN")
+        
+    def commit(self):
+        """Commit the current transaction"""
+        if not self.conn:
+            raise RuntimeError("Not connected to a database")
+        self.conn.commit()
+        
+    def rollback(self):
+        """Roll back the current transaction"""
+        if not self.conn:
+            raise RuntimeError("Not connected to a database")
+        self.conn.rollback()
+        
+    @contextmanager
+    def transaction(self):
+        """
+        Group several statements into one transaction
+        
+        Commits when the block exits normally and rolls back if it raises.
+        Writes inside the block share a single COMMIT instead of one each.
+        Nested use joins the transaction that is already open.
+        
+        Example:
+            with db.transaction():
+                db.execute_query("INSERT INTO users (username) VALUES (?)", ("a",))
+                db.execute_query("INSERT INTO users (username) VALUES (?)", ("b",))
+        """
+        if not self.conn:
+            raise RuntimeError("Not connected to a database")
+            
+        if self.conn.in_transaction:
+            yield self
+            return
+            
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        else:
+            self.commit()
+            
     def get_tables(self):
         """Get list of all tables in the database"""
-        query = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-        results = self.execute_query(query)
+        results = self.execute_query(_SQL_LIST_TABLES)
         return [row['name'] for row in results] if results else []
         
     def get_table_schema(self, table_name):
         """Get the schema for a specific table"""
-        query = f"PRAGMA table_info({table_name})"
-        return self.execute_query(query)
+        return self.execute_query(_SQL_TABLE_INFO, (table_name,))
         
     def export_to_sql(self, output_file):
         """
@@ -160,9 +473,24 @@ class DatabaseManager:
         if not self.conn:
             raise RuntimeError("Not connected to a database")
             
-        with open(output_file, 'w') as f:
-            for line in self.conn.iterdump():
-                f.write(f'{line}\n')
+        # iterdump() only needs plain tuples; skip building a sqlite3.Row
+        # for every row it reads while dumping
+        row_factory = self.conn.row_factory
+        self.conn.row_factory = None
+        try:
+            # Write the dump in chunks of lines through a 1 MiB buffer rather
+            # than one small write() per statement
+            with open(output_file, 'w', buffering=1 << 20, encoding='utf-8') as f:
+                chunk = []
+                for line in self.conn.iterdump():
+                    chunk.append(line)
+                    if len(chunk) >= 1000:
+                        f.write('\n'.join(chunk) + '\n')
+                        chunk = []
+                if chunk:
+                    f.write('\n'.join(chunk) + '\n')
+        finally:
+            self.conn.row_factory = row_factory
                 
         print(f"✓ Database exported to: {output_file}")
         
@@ -176,11 +504,15 @@ class DatabaseManager:
         if not self.conn:
             raise RuntimeError("Not connected to a database")
             
-        with open(sql_file, 'r') as f:
+        with open(sql_file, 'r', encoding='utf-8') as f:
             sql_script = f.read()
             
-        self.conn.executescript(sql_script)
-        self.conn.commit()
+        # Dumps carry their own BEGIN/COMMIT and often PRAGMA foreign_keys=OFF,
+        # so run the file exactly as written
+        try:
+            self._execute_script(sql_script, wrap=False)
+        finally:
+            self.conn.execute("PRAGMA foreign_keys = ON")
         print(f"✓ SQL file imported: {sql_file}")
         
     def show_database_info(self):
@@ -189,30 +521,59 @@ class DatabaseManager:
             print("Not connected to any database")
             return
             
-        print(f"\n{'='*60}")
-        print(f"Database: {self.db_path}")
-        print(f"{'='*60}")
-        
-        tables = self.get_tables()
-        print(f"\nTables ({len(tables)}):")
-        
-        for table in tables:
-            print(f"\n  📊 {table}")
-            schema = self.get_table_schema(table)
-            if schema:
-                print("    Columns:")
-                for col in schema:
-                    pk = " (PRIMARY KEY)" if col['pk'] else ""
-                    notnull = " NOT NULL" if col['notnull'] else ""
-                    default = f" DEFAULT {col['dflt_value']}" if col['dflt_value'] else ""
-                    print(f"      - {col['name']}: {col['type']}{pk}{notnull}{default}")
+        # Fetch every table's columns in one query instead of one per table
+        columns = self.execute_query(_SQL_ALL_COLUMNS) or []
+        tables = [(table, list(cols)) for table, cols in itertools.groupby(columns, key=lambda c: c['tbl'])]
+        
+        # Build the report and write it in one go rather than a print() per line
+        out = ['', '=' * 60, f"Database: {self.db_path}", '=' * 60, '', f"Tables ({len(tables)}):"]
+        for table, schema in tables:
+            out.append('')
+            out.append(f"  📊 {table}")
+            out.append("    Columns:")
+            for col in schema:
+                pk = " (PRIMARY KEY)" if col['pk'] else ""
+                notnull = " NOT NULL" if col['notnull'] else ""
+                default = f" DEFAULT {col['dflt_value']}" if col['dflt_value'] else ""
+                out.append(f"      - {col['name']}: {col['type']}{pk}{notnull}{default}")
+        out.extend(['', '=' * 60, ''])
+        sys.stdout.write('\n'.join(out) + '\n')
+        
+    def release(self):
+        """
+        Hand the connection back to the pool without closing it
+        
+        The connection stays open so the next connect() to the same path is
+        warm. Connections that aren't pooled (in-memory or private) are closed.
+        """
+        if not self.conn:
+            return
+            
+        key = _pool_key(self.db_path)
+        with _pool_lock:
+            entry = _connection_pool.get(key) if key else None
+            pooled = entry is not None and entry[0] is self.conn
+            if pooled:
+                entry[1] = 0
+                if self.conn.in_transaction:
+                    self.conn.rollback()
                     
-        print(f"\n{'='*60}\n")
+        if not pooled:
+            self.conn.close()
+        self.conn = None
+        self.cursor = None
         
     def close(self):
-        """Close the database connection"""
+        """Close the database connection and remove it from the pool"""
         if self.conn:
+            key = _pool_key(self.db_path)
+            with _pool_lock:
+                entry = _connection_pool.get(key) if key else None
+                if entry and entry[0] is self.conn:
+                    del _connection_pool[key]
             self.conn.close()
+            self.conn = None
+            self.cursor = None
             print("✓ Database connection closed")
             
 
@@ -244,8 +605,16 @@ def main():
         try:
             if choice == '1':
                 db_path = input("Enter database path (e.g., mydatabase.db): ").strip()
+                overwrite = False
+                if os.path.exists(db_path):
+                    response = input(f"Database {db_path} already exists. Overwrite? (yes/no): ")
+                    if response.lower() != 'yes':
+                        print("Operation cancelled.")
+                        continue
+                    overwrite = True
                 schema_file = input("Enter schema file path (or press Enter to skip): ").strip()
-                db_manager.create_database(db_path, schema_file if schema_file else None)
+                db_manager.create_database(db_path, schema_file if schema_file else None,
+                                           overwrite=overwrite)
                 
             elif choice == '2':
                 db_path = input("Enter database path: ").strip()
@@ -267,8 +636,10 @@ def main():
                 
                 if results:
                     print(f"\nResults ({len(results)} rows):")
-                    for row in results:
-                        print(dict(row))
+                    # Rows as CSV under a header of column names
+                    writer = csv.writer(sys.stdout, lineterminator='\n')
+                    writer.writerow(results[0].keys())
+                    writer.writerows(results)
                 else:
                     print("✓ Query executed successfully")
                     
@@ -308,8 +679,8 @@ def main():
                 
         except Exception as e:
             print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
 
 
 if __name__ == "__main__":
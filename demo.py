@@ -8,6 +8,10 @@ import os
 import tempfile
 from pathlib import Path
 
+_INSERT_AUTHOR = "INSERT INTO authors (name, country, birth_year) VALUES (?, ?, ?)"
+_INSERT_BOOK = """INSERT INTO books (title, author_id, isbn, published_year, genre, price, stock)
+                  VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
 def demo():
     print("=" * 70)
     print("SQL-PANCAKE DEMONSTRATION")
@@ -19,10 +23,7 @@ def demo():
     db = DatabaseManager()
     demo_db = str(Path(tempfile.gettempdir()) / "demo_library.db")
     
-    if os.path.exists(demo_db):
-        os.remove(demo_db)
-    
-    db.create_database(demo_db)
+    db.create_database(demo_db, overwrite=True)
     
     # Create tables with best practices
     print("\n📊 Step 2: Creating tables with best practices...")
@@ -71,11 +72,8 @@ def demo():
         ("Gabriel García Márquez", "Colombia", 1927)
     ]
     
-    for name, country, birth_year in authors:
-        db.execute_query(
-            "INSERT INTO authors (name, country, birth_year) VALUES (?, ?, ?)",
-            (name, country, birth_year)
-        )
+    with db.transaction():
+        db.executemany(_INSERT_AUTHOR, authors)
     print(f"  ✓ Inserted {len(authors)} authors")
     
     # Insert books
@@ -86,12 +84,8 @@ def demo():
         ("One Hundred Years of Solitude", 3, "978-0060883287", 1967, "Magical Realism", 18.99, 20)
     ]
     
-    for title, author_id, isbn, year, genre, price, stock in books:
-        db.execute_query(
-            """INSERT INTO books (title, author_id, isbn, published_year, genre, price, stock) 
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (title, author_id, isbn, year, genre, price, stock)
-        )
+    with db.transaction():
+        db.executemany(_INSERT_BOOK, books)
     print(f"  ✓ Inserted {len(books)} books")
     
     # Query and display data
@@ -155,7 +149,8 @@ def demo():
     export_file = str(Path(tempfile.gettempdir()) / "library_backup.sql")
     db.export_to_sql(export_file)
     
-    # Show file size
+    # Show file size (checkpoint first so WAL contents are in the main file)
+    db.execute_query("PRAGMA wal_checkpoint(TRUNCATE)")
     file_size = os.path.getsize(demo_db)
     export_size = os.path.getsize(export_file)
     print(f"  Database file size: {file_size:,} bytes")
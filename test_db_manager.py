@@ -5,6 +5,7 @@ Test script for DatabaseManager - Validates functionality
 
 import os
 import sys
+import sqlite3
 import tempfile
 from pathlib import Path
 from db_manager import DatabaseManager
@@ -43,14 +44,11 @@ def test_database_operations():
     
     # Test 3: Insert data
     print("\n3. Testing data insertion...")
-    db.execute_query(
-        "INSERT INTO users (username, email) VALUES (?, ?)",
-        ("john_doe", "john@example.com")
-    )
-    db.execute_query(
-        "INSERT INTO users (username, email) VALUES (?, ?)",
-        ("jane_smith", "jane@example.com")
-    )
+    with db.transaction():
+        db.executemany(
+            "INSERT INTO users (username, email) VALUES (?, ?)",
+            [("john_doe", "john@example.com"), ("jane_smith", "jane@example.com")]
+        )
     print("✓ Data inserted successfully")
     
     # Test 4: Query data
@@ -94,18 +92,20 @@ def test_database_operations():
     
     # Test 9: Foreign key constraints
     print("\n9. Testing foreign key constraints...")
-    db.execute_query("""
-        CREATE TABLE posts (
-            post_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            title TEXT NOT NULL,
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
+    with db.transaction():
+        db.execute_query("""
+            CREATE TABLE posts (
+                post_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                FOREIGN KEY (user_id) REFERENCES users(user_id)
+            )
+        """)
+        db.execute_query(
+            "INSERT INTO posts (user_id, title) VALUES (?, ?)",
+            (1, "My First Post")
         )
-    """)
-    db.execute_query(
-        "INSERT INTO posts (user_id, title) VALUES (?, ?)",
-        (1, "My First Post")
-    )
+    assert len(db.execute_query("SELECT * FROM posts")) == 1, "Post should be committed"
     print("✓ Foreign key constraints working")
     
     # Test 10: Show database info
@@ -128,6 +128,39 @@ def test_database_operations():
     else:
         print(f"  Tables: {', '.join(tables)}")
     
+    # Test 12: Failed batch inside a transaction rolls back
+    print("\n12. Testing rollback of a failed batch...")
+    try:
+        with db.transaction():
+            db.executemany(
+                "INSERT INTO users (username, email) VALUES (?, ?)",
+                [("alice", "alice@example.com"), ("john_doe", "dup@example.com")]
+            )
+        raise AssertionError("Duplicate username should raise")
+    except sqlite3.IntegrityError:
+        pass
+    results = db.execute_query("SELECT * FROM users")
+    assert len(results) == 2, f"Failed batch should leave 2 users, got {len(results)}"
+    print("✓ Failed batch rolled back")
+    
+    # Test 13: Import a dump that turns foreign keys off
+    print("\n13. Testing import of a sqlite3 CLI style dump...")
+    import_path = str(tmp_dir / "test_import.sql")
+    with open(import_path, 'w', encoding='utf-8') as f:
+        f.write(
+            "PRAGMA foreign_keys=OFF;\n"
+            "BEGIN TRANSACTION;\n"
+            "CREATE TABLE parent (id INTEGER PRIMARY KEY);\n"
+            "CREATE TABLE child (id INTEGER PRIMARY KEY, parent_id INTEGER REFERENCES parent(id));\n"
+            "INSERT INTO child VALUES(1, 1);\n"
+            "INSERT INTO parent VALUES(1);\n"
+            "COMMIT;\n"
+        )
+    db.import_from_sql(import_path)
+    assert len(db.execute_query("SELECT * FROM child")) == 1, "Dump rows should be imported"
+    assert db.execute_query("PRAGMA foreign_keys")[0][0] == 1, "Foreign keys should be back on"
+    print("✓ Dump imported successfully")
+    
     # Close connections
     db.close()
     db2.close()
@@ -139,6 +172,8 @@ def test_database_operations():
         os.remove(export_path)
     if os.path.exists(blog_db_path):
         os.remove(blog_db_path)
+    if os.path.exists(import_path):
+        os.remove(import_path)
     
     print("\n" + "=" * 60)
     print("✅ All tests passed! Database Manager is working correctly.")